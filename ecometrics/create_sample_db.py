@@ -8,60 +8,88 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+def downcast_numeric(df):
+    """Shrink numeric columns to the narrowest dtype that fits the values.
+
+    Halving column width halves what DuckDB has to scan and store; the
+    sample values all fit comfortably in float32/int32.
+    """
+    for col in df.select_dtypes(include='float64').columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    for col in df.select_dtypes(include='int64').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
 def create_sample_database():
     """Create a small sample database with basic tables."""
-    
+
     # Connect to database (will create if doesn't exist)
     conn = duckdb.connect("sample_portfolio.duckdb")
-    
-    # Create sample ESG data
+
+    # One transaction around all the table creations: a single commit at
+    # the end instead of a micro-commit per CREATE TABLE statement
+    conn.execute("BEGIN")
+
+
+    # Create sample ESG data: build whole columns at once instead of a
+    # dict per row, so pandas never walks the per-row parsing path
     dates = pd.date_range('2023-01-01', periods=12, freq='M')
-    esg_data = []
-    
-    for date in dates:
-        for product in ['Product A', 'Product B']:
-            esg_data.append({
-                'date': date,
-                'product_line': product,
-                'total_emissions_kg_co2': np.random.randint(800, 1200),
-                'avg_recycled_material_pct': np.random.uniform(70, 85),
-                'avg_efficiency_rating': np.random.uniform(7.5, 9.0),
-                'avg_quality_score': np.random.uniform(8.5, 9.5),
-                'avg_waste_reduction_pct': np.random.uniform(15, 25)
-            })
-    
-    esg_df = pd.DataFrame(esg_data)
-    conn.execute("CREATE TABLE IF NOT EXISTS fact_esg_monthly AS SELECT * FROM esg_df")
+    products = ['Product A', 'Product B']
+    n_rows = len(dates) * len(products)
+
+    esg_df = downcast_numeric(pd.DataFrame({
+        'date': dates.repeat(len(products)),
+        'product_line': np.tile(products, len(dates)),
+        'total_emissions_kg_co2': np.random.randint(800, 1200, n_rows),
+        'avg_recycled_material_pct': np.random.uniform(70, 85, n_rows),
+        'avg_efficiency_rating': np.random.uniform(7.5, 9.0, n_rows),
+        'avg_quality_score': np.random.uniform(8.5, 9.5, n_rows),
+        'avg_waste_reduction_pct': np.random.uniform(15, 25, n_rows)
+    }))
+    # Categorical storage: compact integer codes plus one small category
+    # list instead of a Python string object per row; DuckDB dictionary-
+    # encodes it on ingest
+    esg_df['product_line'] = esg_df['product_line'].astype('category')
+    # Register each frame explicitly instead of relying on DuckDB's implicit
+    # replacement scan, which resolves the Python frame variable by name;
+    # unregister after each CTAS so the temporary views do not show up in
+    # the closing table summary
+    conn.register("esg_view", esg_df)
+    conn.execute("CREATE TABLE IF NOT EXISTS fact_esg_monthly AS SELECT * FROM esg_view")
+    conn.unregister("esg_view")
     
     # Create sample financial data
-    finance_data = []
-    for date in dates:
-        for product in ['Product A', 'Product B']:
-            revenue = np.random.randint(50000, 150000)
-            cost = revenue * np.random.uniform(0.6, 0.8)
-            profit = revenue - cost
-            
-            finance_data.append({
-                'date': date,
-                'product_line': product,
-                'total_revenue': revenue,
-                'total_cost': cost,
-                'total_profit': profit,
-                'total_profit_margin': (profit / revenue) * 100,
-                'units_sold': np.random.randint(100, 500)
-            })
-    
-    finance_df = pd.DataFrame(finance_data)
-    conn.execute("CREATE TABLE IF NOT EXISTS fact_financial_monthly AS SELECT * FROM finance_df")
-    
+    revenue = np.random.randint(50000, 150000, n_rows)
+    cost = revenue * np.random.uniform(0.6, 0.8, n_rows)
+    profit = revenue - cost
+
+    finance_df = downcast_numeric(pd.DataFrame({
+        'date': dates.repeat(len(products)),
+        'product_line': np.tile(products, len(dates)),
+        'total_revenue': revenue,
+        'total_cost': cost,
+        'total_profit': profit,
+        'total_profit_margin': (profit / revenue) * 100,
+        'units_sold': np.random.randint(100, 500, n_rows)
+    }))
+    finance_df['product_line'] = finance_df['product_line'].astype('category')
+    conn.register("finance_view", finance_df)
+    conn.execute("CREATE TABLE IF NOT EXISTS fact_financial_monthly AS SELECT * FROM finance_view")
+    conn.unregister("finance_view")
+
     # Create sample staging data
     stg_esg_data = esg_df.copy()
     stg_esg_data['transaction_id'] = range(len(stg_esg_data))
-    conn.execute("CREATE TABLE IF NOT EXISTS stg_esg_data AS SELECT * FROM stg_esg_data")
-    
+    conn.register("stg_esg_view", stg_esg_data)
+    conn.execute("CREATE TABLE IF NOT EXISTS stg_esg_data AS SELECT * FROM stg_esg_view")
+    conn.unregister("stg_esg_view")
+
     stg_sales_data = finance_df.copy()
     stg_sales_data['transaction_id'] = range(len(stg_sales_data))
-    conn.execute("CREATE TABLE IF NOT EXISTS stg_sales_data AS SELECT * FROM stg_sales_data")
+    conn.register("stg_sales_view", stg_sales_data)
+    conn.execute("CREATE TABLE IF NOT EXISTS stg_sales_data AS SELECT * FROM stg_sales_view")
+    conn.unregister("stg_sales_view")
     
     # Create mart table
     mart_data = [{
@@ -75,8 +103,13 @@ def create_sample_database():
     }]
     
     mart_df = pd.DataFrame(mart_data)
-    conn.execute("CREATE TABLE IF NOT EXISTS mart_esg_summary AS SELECT * FROM mart_df")
-    
+    conn.register("mart_view", mart_df)
+    conn.execute("CREATE TABLE IF NOT EXISTS mart_esg_summary AS SELECT * FROM mart_view")
+    conn.unregister("mart_view")
+
+    conn.execute("COMMIT")
+
+
     # Show table info
     tables = conn.execute("SHOW TABLES").fetchdf()
     print(f"Created {len(tables)} tables:")
@@ -9,15 +9,37 @@ from streamlit.runtime.caching import cache_data
 import pandas as pd
 import duckdb
 import os
+import queue
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging: default to WARNING so hot paths skip log formatting;
+# raise to DEBUG locally when tracing connection issues
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
+# Cursors available for concurrent query execution; DuckDB parallelizes
+# within a query, so a handful of connections is enough
+_CURSOR_POOL_SIZE = 4
+
+# Database search order: Streamlit Cloud (repo root), current directory,
+# local development, and relative from the ecometrics directory
+_DB_SEARCH_PATHS = (
+    "ecometrics/portfolio.duckdb",
+    "portfolio.duckdb",
+    "data/processed/portfolio.duckdb",
+    "../data/processed/portfolio.duckdb",
+)
+
+# Resolve the path once at import: a single is_file() stat per candidate,
+# instead of re-walking the search list every time a connection is built
+_RESOLVED_DB_PATH = next(
+    (p for p in _DB_SEARCH_PATHS if Path(p).is_file()), "portfolio.duckdb"
+)
+
+
 class DuckDBConnection(ExperimentalBaseConnection[duckdb.DuckDBPyConnection]):
     """Streamlit connection for DuckDB database"""
     
@@ -25,82 +47,132 @@ class DuckDBConnection(ExperimentalBaseConnection[duckdb.DuckDBPyConnection]):
         # Try to get database path from secrets or kwargs
         if 'database' in kwargs:
             db_path = kwargs.pop('database')
-            logger.info(f"Using database path from kwargs: {db_path}")
+            logger.debug("Using database path from kwargs: %s", db_path)
         elif 'database' in self._secrets:
             db_path = self._secrets['database']
-            logger.info(f"Using database path from secrets: {db_path}")
+            logger.debug("Using database path from secrets: %s", db_path)
         else:
-            # Fallback to searching for database file
-            possible_paths = [
-                "ecometrics/portfolio.duckdb",          # Streamlit Cloud (from repo root)
-                "portfolio.duckdb",                     # Current directory
-                "data/processed/portfolio.duckdb",      # Local development
-                "../data/processed/portfolio.duckdb",   # From ecometrics directory
-            ]
-            
-            logger.info(f"Searching for database in paths: {possible_paths}")
-            logger.info(f"Current working directory: {os.getcwd()}")
-            
-            for path in possible_paths:
-                logger.info(f"Checking if path exists: {path}")
-                if os.path.exists(path):
-                    db_path = path
-                    logger.info(f"Found database at: {db_path}")
-                    break
-            else:
-                # Default to current directory
-                db_path = "portfolio.duckdb"
-                logger.warning(f"No database found in search paths, defaulting to: {db_path}")
+            # Fall back to the path resolved once at import time
+            db_path = _RESOLVED_DB_PATH
+            logger.debug("Using module-resolved database path: %s", db_path)
         
-        logger.info(f"Attempting to connect to database: {db_path}")
+        logger.debug("Attempting to connect to database: %s", db_path)
         try:
-            conn = duckdb.connect(database=db_path, **kwargs)
-            logger.info(f"Successfully connected to database: {db_path}")
+            # Size DuckDB to the hosting container instead of its defaults:
+            # match threads to the available cores and cap memory so a heavy
+            # query degrades to spilling instead of an OOM kill. Passing
+            # these at connect time avoids the per-connection PRAGMA calls.
+            config = kwargs.pop('config', {})
+            config.setdefault('threads', os.cpu_count() or 2)
+            config.setdefault('memory_limit', '1GB')
+            # The dashboard only reads; a read-only handle skips WAL/lock
+            # bookkeeping and lets other processes attach concurrently.
+            # Read-only cannot create a missing file, so fall back to the
+            # default mode when the path does not exist yet.
+            kwargs.setdefault('read_only', os.path.exists(db_path))
+            conn = duckdb.connect(database=db_path, config=config, **kwargs)
+            logger.debug("Connected to %s (read_only=%s, threads=%s)",
+                         db_path, kwargs['read_only'], config['threads'])
             return conn
         except Exception as e:
             logger.error(f"Failed to connect to database {db_path}: {e}")
             raise
     
     def cursor(self) -> duckdb.DuckDBPyConnection:
-        logger.info("Getting cursor from connection...")
-        try:
-            cursor = self._instance.cursor()
-            logger.info("Cursor obtained successfully")
+        # Reuse a single connection clone: duckdb's cursor() duplicates the
+        # connection, which re-runs catalog/extension setup every call
+        cursor = getattr(self, '_cursor', None)
+        if cursor is not None:
             return cursor
+        try:
+            self._cursor = self._instance.cursor()
+            return self._cursor
         except Exception as e:
             logger.error(f"Error getting cursor: {e}")
             raise
     
+    def _cursor_pool(self) -> "queue.Queue":
+        # DuckDB runs one query at a time per connection, so concurrent
+        # Streamlit sessions sharing self._instance would serialize. Each
+        # cursor() clone is an independent connection onto the same file;
+        # a small bounded pool lets sessions query in parallel.
+        pool = getattr(self, '_pool', None)
+        if pool is None:
+            pool = queue.Queue(maxsize=_CURSOR_POOL_SIZE)
+            for _ in range(_CURSOR_POOL_SIZE):
+                pool.put(self._instance.cursor())
+            self._pool = pool
+        return pool
+
     def query(self, query: str, ttl: int = 3600, **kwargs) -> pd.DataFrame:
         @cache_data(ttl=ttl)
-        def _query(query: str, **kwargs) -> pd.DataFrame:
-            cursor = self.cursor()
-            cursor.execute(query, **kwargs)
-            return cursor.df()
-        
-        return _query(query, **kwargs)
+        def _query_arrow(query: str, **kwargs):
+            # Fetch as Arrow: the cache then serializes a compact Arrow IPC
+            # buffer instead of pickling a pandas DataFrame
+            pool = self._cursor_pool()
+            conn = pool.get()
+            try:
+                result = conn.execute(query, **kwargs)
+                try:
+                    return result.to_arrow_table()
+                except AttributeError:
+                    # fetch_arrow_table() is the pre-1.5 name
+                    return result.fetch_arrow_table()
+            finally:
+                pool.put(conn)
+
+        # Arrow -> pandas is zero-copy for numeric columns, so cache hits
+        # rebuild the frame without reallocating the data buffers.
+        # date_as_object=False keeps DATE columns as datetime64 so callers
+        # can compare them against pandas Timestamps, matching .df()
+        return _query_arrow(query, **kwargs).to_pandas(date_as_object=False)
+
+    def query_rel(self, query: str) -> duckdb.DuckDBPyRelation:
+        """Return a lazy DuckDB relation for the query instead of a DataFrame.
+
+        The relation defers execution until it is consumed, so callers can
+        chain further filters or aggregations and let DuckDB plan the whole
+        pipeline before anything is materialized into pandas. Not cached:
+        relations hold a live connection handle and are cheap to rebuild.
+        """
+        return self._instance.sql(query)
+
+    def scalar(self, query: str, ttl: int = 3600, **kwargs) -> Any:
+        """Run a query that yields a single value and fetch it directly.
+
+        Skips the DataFrame construction that query() pays, which matters
+        for COUNT(*)/existence checks issued per rerun.
+        """
+        @cache_data(ttl=ttl, show_spinner=False)
+        def _scalar(query: str, **kwargs) -> Any:
+            pool = self._cursor_pool()
+            conn = pool.get()
+            try:
+                return conn.execute(query, **kwargs).fetchone()[0]
+            finally:
+                pool.put(conn)
+
+        return _scalar(query, **kwargs)
     
     def get_available_tables(self, ttl: int = 3600) -> List[str]:
         """Get list of available tables in the database."""
         @cache_data(ttl=ttl, show_spinner=False)
         def _get_tables() -> List[str]:
-            logger.info("Getting available tables from database...")
             try:
-                cursor = self.cursor()
-                logger.info("Cursor obtained successfully")
-                
-                logger.info("Executing SHOW TABLES query...")
-                tables = cursor.execute("SHOW TABLES").fetchdf()
-                logger.info(f"SHOW TABLES query result: {tables}")
-                
-                table_list = tables['name'].tolist()
-                logger.info(f"Found {len(table_list)} tables: {table_list}")
+                # Fetch the handful of names as plain tuples; building a
+                # pandas DataFrame for this list is pure overhead
+                rows = self._instance.execute(
+                    "SELECT table_name FROM information_schema.tables"
+                    " WHERE table_schema = 'main'"
+                ).fetchall()
+                table_list = [row[0] for row in rows]
+                logger.debug("Found %d tables: %s", len(table_list), table_list)
                 return table_list
             except Exception as e:
-                logger.error(f"Error getting tables: {e}")
-                logger.error(f"Error type: {type(e)}")
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
+                logger.error("Error getting tables: %s", e)
+                if logger.isEnabledFor(logging.DEBUG):
+                    import traceback
+                    logger.debug("Full traceback: %s", traceback.format_exc())
                 return []
         
         return _get_tables()
@@ -109,55 +181,93 @@ class DuckDBConnection(ExperimentalBaseConnection[duckdb.DuckDBPyConnection]):
         """Get information about a specific table."""
         @cache_data(ttl=ttl)
         def _get_table_info(table_name: str) -> Dict[str, Any]:
-            cursor = self.cursor()
-            
-            # Get table schema
-            schema = cursor.execute(f"DESCRIBE {table_name}").fetchdf()
-            
-            # Get row count
-            count = cursor.execute(f"SELECT COUNT(*) as count FROM {table_name}").fetchdf()
-            
-            # Get sample data
-            sample = cursor.execute(f"SELECT * FROM {table_name} LIMIT 5").fetchdf()
-            
+            # Schema from the catalog (parameterized), count as a plain
+            # scalar, and an unordered LIMIT sample that stops after the
+            # first rows instead of scanning the table
+            schema = self._instance.execute(
+                """
+                SELECT column_name, data_type AS column_type
+                FROM information_schema.columns
+                WHERE table_name = ?
+                ORDER BY ordinal_position
+                """,
+                [table_name]
+            ).df()
+
+            row_count = self._instance.execute(
+                f'SELECT COUNT(*) FROM "{table_name}"'
+            ).fetchone()[0]
+
+            # Project only the columns the browser actually renders instead
+            # of SELECT *: for wide tables the unrendered columns would
+            # otherwise still be sampled and shipped into pandas
+            sample_cols = ", ".join(
+                f'"{col}"' for col in schema['column_name'].head(20)
+            )
+            sample = self._instance.execute(
+                f'SELECT {sample_cols} FROM "{table_name}" LIMIT 5'
+            ).df()
+
             return {
                 'schema': schema,
-                'row_count': count['count'].iloc[0],
+                'row_count': row_count,
                 'sample_data': sample,
                 'columns': schema['column_name'].tolist()
             }
         
         return _get_table_info(table_name)
-    
+
+    def get_all_table_columns(self, ttl: int = 3600) -> Dict[str, List[str]]:
+        """Get the column names of every table from one catalog query."""
+        @cache_data(ttl=ttl, show_spinner=False)
+        def _get_all_columns() -> Dict[str, List[str]]:
+            rows = self._instance.execute(
+                """
+                SELECT table_name, column_name
+                FROM information_schema.columns
+                WHERE table_schema = 'main'
+                ORDER BY table_name, ordinal_position
+                """
+            ).fetchall()
+            columns_by_table: Dict[str, List[str]] = {}
+            for table, column in rows:
+                columns_by_table.setdefault(table, []).append(column)
+            return columns_by_table
+
+        return _get_all_columns()
+
     def get_data_quality_metrics(self, ttl: int = 3600) -> Dict[str, Any]:
         """Get data quality metrics for all tables."""
         @cache_data(ttl=ttl)
         def _get_metrics() -> Dict[str, Any]:
             cursor = self.cursor()
             metrics = {}
-            
+
             try:
-                tables = cursor.execute("SHOW TABLES").fetchdf()
-                
-                for table in tables['name']:
+                # One cached catalog query covers schema discovery for every
+                # table, replacing the SHOW TABLES + per-table DESCRIBE pair
+                columns_by_table = self.get_all_table_columns(ttl=ttl)
+
+                for table, columns in columns_by_table.items():
                     try:
-                        # Get row count
-                        count_query = f"SELECT COUNT(*) as count FROM {table}"
-                        count = cursor.execute(count_query).fetchdf()
-                        
-                        # Get null counts for each column
-                        schema = cursor.execute(f"DESCRIBE {table}").fetchdf()
-                        null_counts = {}
-                        
-                        for col in schema['column_name']:
-                            null_query = f"SELECT COUNT(*) as null_count FROM {table} WHERE {col} IS NULL"
-                            null_count = cursor.execute(null_query).fetchdf()
-                            null_counts[col] = null_count['null_count'].iloc[0]
-                        
+                        # One scan per table: COUNT(col) skips NULLs, so the
+                        # null count per column is row_count - COUNT(col).
+                        # Replaces the per-column WHERE col IS NULL queries.
+                        count_exprs = ", ".join(
+                            f'COUNT("{col}") AS "nn_{i}"' for i, col in enumerate(columns)
+                        )
+                        counts_query = f'SELECT COUNT(*) AS row_count, {count_exprs} FROM "{table}"'
+                        counts = cursor.execute(counts_query).fetchone()
+
+                        row_count = counts[0]
+                        null_counts = {
+                            col: row_count - counts[i + 1] for i, col in enumerate(columns)
+                        }
+
                         metrics[table] = {
-                            'row_count': count['count'].iloc[0],
+                            'row_count': row_count,
                             'null_counts': null_counts,
-                            'columns': schema['column_name'].tolist()
+                            'columns': columns
                         }
                     except Exception as e:
                         logger.warning(f"Failed to get metrics for {table}: {e}")
@@ -171,48 +281,60 @@ class DuckDBConnection(ExperimentalBaseConnection[duckdb.DuckDBPyConnection]):
         return _get_metrics()
 
 
+@st.cache_resource
 def get_data_connector() -> DuckDBConnection:
     """
     Get a Streamlit connection to the DuckDB database.
-    
+
+    Cached as a resource so the underlying DuckDB connection (and its file
+    handles / prepared statements) persists across reruns instead of being
+    reconstructed on every script execution.
+
     Returns:
         DuckDBConnection instance
     """
     return st.connection("duckdb_v2", type=DuckDBConnection)
 
 
+# Key dbt models the dashboard depends on; fixed at module scope so the
+# availability check does set membership instead of rebuilding the list
+KEY_MODELS = ('fact_esg_monthly', 'fact_financial_monthly', 'stg_sales_data', 'stg_esg_data')
+
+
+@st.cache_data(ttl=300, show_spinner=False)
 def check_dbt_availability() -> Dict[str, Any]:
     """
     Check if dbt data is available and provide status information.
-    
+
+    Cached at the process level so reruns within the TTL reuse the verdict
+    without touching the database.
+
     Returns:
         Dictionary with availability status and information
     """
-    logger.info("Starting dbt availability check...")
+    logger.debug("Starting dbt availability check...")
     try:
         connector = get_data_connector()
-        logger.info("Data connector created successfully")
-        
+
         # Try to get tables to test connection
-        logger.info("Attempting to get available tables...")
         tables = connector.get_available_tables(ttl=60)  # Short TTL for status check
-        logger.info(f"Retrieved {len(tables)} tables: {tables}")
-        
-        # Check for key dbt models
-        key_models = ['fact_esg_monthly', 'fact_financial_monthly', 'stg_sales_data', 'stg_esg_data']
-        available_models = [model for model in key_models if model in tables]
-        logger.info(f"Found {len(available_models)}/{len(key_models)} key models: {available_models}")
+        logger.debug("Retrieved %d tables: %s", len(tables), tables)
+
+        # Check for key dbt models with O(1) membership tests
+        tables_set = frozenset(tables)
+        available_models = [model for model in KEY_MODELS if model in tables_set]
+        logger.debug("Found %d/%d key models: %s", len(available_models), len(KEY_MODELS), available_models)
         
         result = {
             'available': len(available_models) > 0,
-            'message': f"Found {len(available_models)}/{len(key_models)} key models",
+            'message': f"Found {len(available_models)}/{len(KEY_MODELS)} key models",
             'available_tables': tables,
             'key_models_found': available_models,
-            'key_models_missing': [model for model in key_models if model not in tables],
+            'key_models_missing': [model for model in KEY_MODELS if model not in tables_set],
             'db_path': 'portfolio.duckdb',  # This will be resolved by the connection
             'deployment_note': 'Database connection successful!'
         }
-        logger.info(f"Availability check result: {result}")
+        logger.debug("Availability check result: %s", result)
         return result
     except Exception as e:
         logger.error(f"Error during availability check: {e}")
@@ -224,105 +346,222 @@ def check_dbt_availability() -> Dict[str, Any]:
         }
 
 
-def load_esg_data() -> Tuple[pd.DataFrame, str]:
+def _build_filter_clause(start_date=None, end_date=None,
+                         product_line: Optional[str] = None) -> Tuple[str, list]:
     """
-    Load ESG data from dbt models.
-    
+    Build a parameterized WHERE clause for the optional loader filters.
+
+    Pushing the predicates into DuckDB lets the engine filter on columnar
+    storage instead of materializing full tables into pandas first.
+
+    Returns:
+        Tuple of (where_clause, parameters)
+    """
+    clauses = []
+    params: list = []
+    if start_date is not None and end_date is not None:
+        clauses.append("date BETWEEN ? AND ?")
+        params.extend([start_date, end_date])
+    if product_line is not None:
+        clauses.append("product_line = ?")
+        params.append(product_line)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def _build_projection(columns: Optional[List[str]] = None) -> str:
+    """
+    Build a quoted projection list, or * when no columns are requested.
+
+    Projection happens only on the fact tables, whose schemas are known;
+    staging fallbacks keep SELECT * since their column names differ.
+    """
+    if not columns:
+        return "*"
+    return ", ".join(f'"{col}"' for col in columns)
+
+
+def load_esg_data(start_date=None, end_date=None,
+                  product_line: Optional[str] = None,
+                  order_by: Optional[str] = None,
+                  columns: Optional[List[str]] = None) -> Tuple[pd.DataFrame, str]:
+    """
+    Load ESG data from dbt models, optionally filtered in SQL.
+
+    Args:
+        start_date: Inclusive start of the date range filter
+        end_date: Inclusive end of the date range filter
+        product_line: Restrict to a single product line
+        order_by: Optional ORDER BY clause body (e.g. "date DESC"); by
+            default no sort is requested, since consumers re-aggregate
+        columns: Restrict the fact-table projection to these columns so
+            unread columns are never materialized into pandas
+
     Returns:
         Tuple of (DataFrame, status_message)
     """
+    where, params = _build_filter_clause(start_date, end_date, product_line)
+    order = f" ORDER BY {order_by}" if order_by else ""
+    cols = _build_projection(columns)
     try:
         connector = get_data_connector()
-        
+
         # Try to load from fact_esg_monthly first
-        query = """
-        SELECT * FROM fact_esg_monthly 
-        ORDER BY date DESC
-        """
-        df = connector.query(query)
+        query = f"SELECT {cols} FROM fact_esg_monthly{where}{order}"
+        df = connector.query(query, parameters=params)
         return df, "Loaded from fact_esg_monthly"
     except Exception as e:
         logger.warning(f"Failed to load from fact_esg_monthly: {e}")
-        
+
         # Fallback to staging table
         try:
-            query = """
-            SELECT * FROM stg_esg_data 
-            ORDER BY date DESC
-            """
-            df = connector.query(query)
+            query = f"SELECT * FROM stg_esg_data{where}{order}"
+            df = connector.query(query, parameters=params)
             return df, "Loaded from stg_esg_data (fallback)"
         except Exception as e2:
             logger.error(f"Failed to load ESG data: {e2}")
             return pd.DataFrame(), f"Error loading ESG data: {e2}"
 
 
-def load_finance_data() -> Tuple[pd.DataFrame, str]:
+def load_finance_data(start_date=None, end_date=None,
+                      product_line: Optional[str] = None,
+                      order_by: Optional[str] = None,
+                      columns: Optional[List[str]] = None) -> Tuple[pd.DataFrame, str]:
     """
-    Load financial data from dbt models.
-    
+    Load financial data from dbt models, optionally filtered in SQL.
+
+    Args:
+        start_date: Inclusive start of the date range filter
+        end_date: Inclusive end of the date range filter
+        product_line: Restrict to a single product line
+        order_by: Optional ORDER BY clause body (e.g. "date DESC"); omitted
+            by default so DuckDB skips the sort for re-aggregating consumers
+        columns: Restrict the fact-table projection to these columns so
+            unread columns are never materialized into pandas
+
     Returns:
         Tuple of (DataFrame, status_message)
     """
+    where, params = _build_filter_clause(start_date, end_date, product_line)
+    order = f" ORDER BY {order_by}" if order_by else ""
+    cols = _build_projection(columns)
     try:
         connector = get_data_connector()
-        
+
         # Try to load from fact_financial_monthly first
-        query = """
-        SELECT * FROM fact_financial_monthly 
-        ORDER BY date DESC
-        """
-        df = connector.query(query)
+        query = f"SELECT {cols} FROM fact_financial_monthly{where}{order}"
+        df = connector.query(query, parameters=params)
         return df, "Loaded from fact_financial_monthly"
     except Exception as e:
         logger.warning(f"Failed to load from fact_financial_monthly: {e}")
-        
+
         # Fallback to staging table
         try:
-            query = """
-            SELECT * FROM stg_sales_data 
-            ORDER BY date DESC
-            """
-            df = connector.query(query)
+            query = f"SELECT * FROM stg_sales_data{where}{order}"
+            df = connector.query(query, parameters=params)
             return df, "Loaded from stg_sales_data (fallback)"
         except Exception as e2:
             logger.error(f"Failed to load finance data: {e2}")
             return pd.DataFrame(), f"Error loading finance data: {e2}"
 
 
-def load_supply_chain_data() -> Tuple[pd.DataFrame, str]:
+def load_supply_chain_data(start_date=None, end_date=None,
+                           order_by: Optional[str] = None,
+                           columns: Optional[List[str]] = None) -> Tuple[pd.DataFrame, str]:
     """
-    Load supply chain data from dbt models.
-    
+    Load supply chain data from dbt models, optionally filtered in SQL.
+
+    Args:
+        start_date: Inclusive start of the date range filter
+        end_date: Inclusive end of the date range filter
+        order_by: Optional ORDER BY clause body (e.g. "date DESC"); omitted
+            by default so DuckDB skips the sort for re-aggregating consumers
+        columns: Restrict the fact-table projection to these columns so
+            unread columns are never materialized into pandas
+
     Returns:
         Tuple of (DataFrame, status_message)
     """
+    where, params = _build_filter_clause(start_date, end_date)
+    order = f" ORDER BY {order_by}" if order_by else ""
+    cols = _build_projection(columns)
     try:
         connector = get_data_connector()
-        
+
         # Try to load from fact_supply_chain_monthly first
-        query = """
-        SELECT * FROM fact_supply_chain_monthly 
-        ORDER BY date DESC
-        """
-        df = connector.query(query)
+        query = f"SELECT {cols} FROM fact_supply_chain_monthly{where}{order}"
+        df = connector.query(query, parameters=params)
         return df, "Loaded from fact_supply_chain_monthly"
     except Exception as e:
         logger.warning(f"Failed to load from fact_supply_chain_monthly: {e}")
-        
+
         # Fallback to staging table
         try:
-            query = """
-            SELECT * FROM stg_supply_chain_data 
-            ORDER BY date DESC
-            """
-            df = connector.query(query)
+            query = f"SELECT * FROM stg_supply_chain_data{where}{order}"
+            df = connector.query(query, parameters=params)
             return df, "Loaded from stg_supply_chain_data (fallback)"
         except Exception as e2:
             logger.error(f"Failed to load supply chain data: {e2}")
             return pd.DataFrame(), f"Error loading supply chain data: {e2}"
 
 
+@st.cache_data(ttl=600, show_spinner=False)
+def get_date_bounds() -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+    """
+    Compute the overall date range across the fact tables in SQL.
+
+    A single MIN/MAX reduction over the unioned date columns replaces
+    pandas-side scans of every loaded frame.
+
+    Returns:
+        Tuple of (min_date, max_date), or (None, None) when unavailable
+    """
+    candidates = ('fact_esg_monthly', 'fact_financial_monthly',
+                  'fact_supply_chain_monthly')
+    try:
+        connector = get_data_connector()
+        tables = [t for t in candidates if t in connector.get_available_tables()]
+        if not tables:
+            return None, None
+        union = " UNION ALL ".join(f"SELECT date FROM {table}" for table in tables)
+        dmin, dmax = connector.cursor().execute(
+            f"SELECT MIN(date), MAX(date) FROM ({union})"
+        ).fetchone()
+        if dmin is None:
+            return None, None
+        return pd.Timestamp(dmin), pd.Timestamp(dmax)
+    except Exception as e:
+        logger.warning(f"Failed to compute date bounds in SQL: {e}")
+        return None, None
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_supply_chain_order_count(start_date=None, end_date=None) -> int:
+    """
+    Count supply chain rows in SQL instead of materializing them in pandas.
+
+    Args:
+        start_date: Inclusive start of the date range filter
+        end_date: Inclusive end of the date range filter
+
+    Returns:
+        Row count, or 0 if no supply chain table is available
+    """
+    where, params = _build_filter_clause(start_date, end_date)
+    try:
+        connector = get_data_connector()
+        for table in ("fact_supply_chain_monthly", "stg_supply_chain_data"):
+            try:
+                cursor = connector.cursor()
+                cursor.execute(f"SELECT COUNT(*) FROM {table}{where}", parameters=params)
+                return cursor.fetchone()[0]
+            except Exception as e:
+                logger.warning(f"Failed to count rows in {table}: {e}")
+    except Exception as e:
+        logger.error(f"Failed to count supply chain rows: {e}")
+    return 0
+
+
 def initialize_sample_data_if_needed():
     """
     Initialize sample data if dbt data is not available.
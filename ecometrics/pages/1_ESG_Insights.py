@@ -89,22 +89,26 @@ with st.sidebar:
         facilities = ['All'] + sorted(esg_data['facility'].unique().tolist())
         selected_facility = st.selectbox("Facility", facilities)
         
-        # Apply filters
-        filtered_data = esg_data.copy()
+        # Apply filters as a single fused query instead of chained boolean
+        # masks, so pandas evaluates one combined predicate and materializes
+        # one filtered frame rather than an intermediate copy per filter
+        predicates = []
         if len(date_range) == 2:
             # Convert date objects to pandas datetime for comparison
             start_date = pd.to_datetime(date_range[0])
             end_date = pd.to_datetime(date_range[1])
-            filtered_data = filtered_data[
-                (filtered_data['date'] >= start_date) & 
-                (filtered_data['date'] <= end_date)
-            ]
-        
+            predicates.append('@start_date <= date <= @end_date')
+
         if selected_product != 'All':
-            filtered_data = filtered_data[filtered_data['product_line'] == selected_product]
-            
+            predicates.append('product_line == @selected_product')
+
         if selected_facility != 'All':
-            filtered_data = filtered_data[filtered_data['facility'] == selected_facility]
+            predicates.append('facility == @selected_facility')
+
+        if predicates:
+            filtered_data = esg_data.query(' and '.join(predicates))
+        else:
+            filtered_data = esg_data.copy()
     else:
         filtered_data = esg_data
 
@@ -505,18 +509,23 @@ if not filtered_data.empty:
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("**Data Coverage:**")
-        st.write(f"- **Time Period:** {filtered_data['date'].min().strftime('%B %Y')} to {filtered_data['date'].max().strftime('%B %Y')}")
-        st.write(f"- **Product Lines:** {len(filtered_data['product_line'].unique())}")
-        st.write(f"- **Facilities:** {len(filtered_data['facility'].unique())}")
-        st.write(f"- **Data Points:** {len(filtered_data):,}")
-    
+        # One markdown block instead of a frontend message per line
+        st.markdown(
+            "**Data Coverage:**\n"
+            f"- **Time Period:** {filtered_data['date'].min().strftime('%B %Y')} to {filtered_data['date'].max().strftime('%B %Y')}\n"
+            f"- **Product Lines:** {len(filtered_data['product_line'].unique())}\n"
+            f"- **Facilities:** {len(filtered_data['facility'].unique())}\n"
+            f"- **Data Points:** {len(filtered_data):,}"
+        )
+
     with col2:
-        st.markdown("**Key Insights:**")
-        st.write("- CO2 emissions tracking across all operations")
-        st.write("- Recycled material usage optimization")
-        st.write("- Renewable energy adoption rates")
-        st.write("- Regional performance comparisons")
+        st.markdown(
+            "**Key Insights:**\n"
+            "- CO2 emissions tracking across all operations\n"
+            "- Recycled material usage optimization\n"
+            "- Renewable energy adoption rates\n"
+            "- Regional performance comparisons"
+        )
 
 # Footer navigation
 st.markdown("---")
@@ -37,8 +37,10 @@ Use the interactive controls to configure forecasting models and analyze differe
 # Load data for forecasting
 @st.cache_data(ttl=3600)
 def load_cached_forecast_data():
-    finance_data, finance_status = load_finance_data()
-    esg_data, esg_status = load_esg_data()
+    # This page reads the frames positionally (iloc[-1] is shown as the
+    # current value), so ask for a date sort instead of relying on scan order
+    finance_data, finance_status = load_finance_data(order_by="date")
+    esg_data, esg_status = load_esg_data(order_by="date")
     return finance_data, esg_data, finance_status, esg_status
 
 with st.spinner("Loading data for forecasting..."):
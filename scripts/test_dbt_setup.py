@@ -14,6 +14,56 @@ import pandas as pd
 import duckdb
 
 
+DB_PATH = "data/processed/portfolio.duckdb"
+
+# Check inputs are constant; defined once instead of rebuilt per call
+REQUIRED_FILES = (
+    "dbt/dbt_project.yml",
+    "dbt/profiles.yml",
+    "dbt/models/sustainability/stg_esg_data.sql",
+    "dbt/models/finance/stg_sales_data.sql",
+    "dbt/models/sustainability/fact_esg_monthly.sql",
+    "dbt/models/finance/fact_financial_monthly.sql",
+    "dbt/seeds/sample_sales_data.csv",
+    "dbt/seeds/sample_esg_data.csv",
+)
+
+NULL_CHECKS = (
+    ("sample_sales_data", "date"),
+    ("sample_sales_data", "product_line"),
+    ("sample_esg_data", "date"),
+    ("sample_esg_data", "product_line"),
+)
+
+NEGATIVE_CHECKS = (
+    ("sample_sales_data", "revenue"),
+    ("sample_sales_data", "units_sold"),
+    ("sample_esg_data", "emissions_kg_co2"),
+    ("sample_esg_data", "energy_consumption_kwh"),
+)
+
+STAGING_MODELS = ("stg_sales_data", "stg_esg_data")
+FACT_MODELS = ("fact_financial_monthly", "fact_esg_monthly")
+
+_con = None
+
+
+def get_connection():
+    """Open the portfolio database once and share it across checks."""
+    global _con
+    if _con is None:
+        _con = duckdb.connect(DB_PATH, read_only=True)
+    return _con
+
+
+def close_connection():
+    """Close the shared connection if one was opened."""
+    global _con
+    if _con is not None:
+        _con.close()
+        _con = None
+
+
 def run_command(command, description, cwd=None):
     """Run a command and return success status."""
     print(f"\n🔄 {description}...")
@@ -60,19 +110,8 @@ def check_project_structure():
     """Check if dbt project structure is correct."""
     print("\n🔍 Checking dbt project structure...")
     
-    required_files = [
-        "dbt/dbt_project.yml",
-        "dbt/profiles.yml",
-        "dbt/models/sustainability/stg_esg_data.sql",
-        "dbt/models/finance/stg_sales_data.sql",
-        "dbt/models/sustainability/fact_esg_monthly.sql",
-        "dbt/models/finance/fact_financial_monthly.sql",
-        "dbt/seeds/sample_sales_data.csv",
-        "dbt/seeds/sample_esg_data.csv"
-    ]
-    
     missing_files = []
-    for file_path in required_files:
+    for file_path in REQUIRED_FILES:
         if not os.path.exists(file_path):
             missing_files.append(file_path)
         else:
@@ -125,9 +164,9 @@ def validate_data_quality():
     print("\n🔍 Validating data quality...")
     
     try:
-        # Connect to DuckDB
-        con = duckdb.connect("data/processed/portfolio.duckdb")
-        
+        # Reuse the shared connection instead of re-opening the database
+        con = get_connection()
+
         # Check if tables exist
         tables_query = """
         SELECT table_name 
@@ -152,14 +191,7 @@ def validate_data_quality():
         print("\n   🔍 Data quality checks:")
         
         # Check for null values in key columns
-        null_checks = [
-            ("sample_sales_data", "date"),
-            ("sample_sales_data", "product_line"),
-            ("sample_esg_data", "date"),
-            ("sample_esg_data", "product_line")
-        ]
-        
-        for table, column in null_checks:
+        for table, column in NULL_CHECKS:
             try:
                 null_count = con.execute(
                     f"SELECT COUNT(*) FROM {table} WHERE {column} IS NULL"
@@ -172,14 +204,7 @@ def validate_data_quality():
                 print(f"      ❌ {table}.{column}: Column not found")
         
         # Check for negative values in numeric columns
-        negative_checks = [
-            ("sample_sales_data", "revenue"),
-            ("sample_sales_data", "units_sold"),
-            ("sample_esg_data", "emissions_kg_co2"),
-            ("sample_esg_data", "energy_consumption_kwh")
-        ]
-        
-        for table, column in negative_checks:
+        for table, column in NEGATIVE_CHECKS:
             try:
                 negative_count = con.execute(
                     f"SELECT COUNT(*) FROM {table} WHERE {column} < 0"
@@ -205,10 +230,9 @@ def validate_data_quality():
                 print(f"      - {table}: {date_range[0]} to {date_range[1]} ({date_range[2]} months)")
             except:
                 print(f"      ❌ {table}: Could not check date range")
-        
-        con.close()
+
         return True
-        
+
     except Exception as e:
         print(f"   ❌ Error validating data: {e}")
         return False
@@ -219,11 +243,10 @@ def check_model_outputs():
     print("\n🔍 Checking model outputs...")
     
     try:
-        con = duckdb.connect("data/processed/portfolio.duckdb")
-        
+        con = get_connection()
+
         # Check staging models
-        staging_models = ["stg_sales_data", "stg_esg_data"]
-        for model in staging_models:
+        for model in STAGING_MODELS:
             try:
                 count = con.execute(f"SELECT COUNT(*) FROM {model}").fetchone()[0]
                 print(f"   ✅ {model}: {count:,} rows")
@@ -231,8 +254,7 @@ def check_model_outputs():
                 print(f"   ❌ {model}: Table not found")
         
         # Check fact models
-        fact_models = ["fact_financial_monthly", "fact_esg_monthly"]
-        for model in fact_models:
+        for model in FACT_MODELS:
             try:
                 count = con.execute(f"SELECT COUNT(*) FROM {model}").fetchone()[0]
                 print(f"   ✅ {model}: {count:,} rows")
@@ -273,10 +295,9 @@ def check_model_outputs():
                 print(f"      ⚠️  Material percentages: {validation[1]}/{validation[0]} correct")
         except:
             print("      ❌ Could not validate material percentages")
-        
-        con.close()
+
         return True
-        
+
     except Exception as e:
         print(f"   ❌ Error checking model outputs: {e}")
         return False
@@ -309,7 +330,9 @@ def main():
         except Exception as e:
             print(f"   ❌ Error in {check_name}: {e}")
             results.append((check_name, False))
-    
+
+    close_connection()
+
     # Summary
     print("\n" + "=" * 60)
     print("📊 Test Summary")
@@ -13,269 +13,280 @@ from typing import Dict, List, Optional, Tuple, Union
 import os
 
 
+# Define product configurations with more realistic details
+_PRODUCTS = {
+    'Plastic Containers': {
+        'base_cost': 3.0,
+        'base_price': 5.0,
+        'emissions_factor': 0.8,  # kg CO2 per unit
+        'energy_factor': 2.5,     # kWh per unit
+        'water_factor': 1.2,      # liters per unit
+        'waste_factor': 0.1,      # kg waste per unit
+        'recycled_material_potential': 0.6,  # max % recycled
+        'virgin_material_potential': 0.4,    # min % virgin
+        'sku_prefix': 'PLASTIC',
+        'weight_kg': 0.5,
+        'volume_liters': 1.0,
+        'shelf_life_days': 365,
+        'regulatory_compliance': ['FDA', 'EU_Food_Safe'],
+        'sustainability_rating': 3  # 1-5 scale
+    },
+    'Paper Packaging': {
+        'base_cost': 2.5,
+        'base_price': 4.5,
+        'emissions_factor': 0.5,
+        'energy_factor': 1.8,
+        'water_factor': 0.8,
+        'waste_factor': 0.05,
+        'recycled_material_potential': 0.8,
+        'virgin_material_potential': 0.2,
+        'sku_prefix': 'PAPER',
+        'weight_kg': 0.3,
+        'volume_liters': 0.8,
+        'shelf_life_days': 180,
+        'regulatory_compliance': ['FDA', 'FSC_Certified'],
+        'sustainability_rating': 4
+    },
+    'Glass Bottles': {
+        'base_cost': 4.0,
+        'base_price': 8.0,
+        'emissions_factor': 1.2,
+        'energy_factor': 4.0,
+        'water_factor': 2.0,
+        'waste_factor': 0.15,
+        'recycled_material_potential': 0.3,
+        'virgin_material_potential': 0.7,
+        'sku_prefix': 'GLASS',
+        'weight_kg': 1.2,
+        'volume_liters': 1.5,
+        'shelf_life_days': 730,
+        'regulatory_compliance': ['FDA', 'EU_Food_Safe', 'Recyclable'],
+        'sustainability_rating': 5
+    },
+    'Aluminum Cans': {
+        'base_cost': 3.5,
+        'base_price': 6.5,
+        'emissions_factor': 1.0,
+        'energy_factor': 3.2,
+        'water_factor': 1.5,
+        'waste_factor': 0.08,
+        'recycled_material_potential': 0.7,
+        'virgin_material_potential': 0.3,
+        'sku_prefix': 'ALUM',
+        'weight_kg': 0.4,
+        'volume_liters': 0.5,
+        'shelf_life_days': 1095,
+        'regulatory_compliance': ['FDA', 'Recyclable'],
+        'sustainability_rating': 4
+    },
+    'Biodegradable Packaging': {
+        'base_cost': 4.5,
+        'base_price': 7.5,
+        'emissions_factor': 0.3,
+        'energy_factor': 1.5,
+        'water_factor': 0.6,
+        'waste_factor': 0.02,
+        'recycled_material_potential': 0.9,
+        'virgin_material_potential': 0.1,
+        'sku_prefix': 'BIO',
+        'weight_kg': 0.2,
+        'volume_liters': 0.6,
+        'shelf_life_days': 90,
+        'regulatory_compliance': ['FDA', 'Biodegradable', 'Compostable'],
+        'sustainability_rating': 5
+    }
+}
+
+# Define facility configurations with more detail
+_FACILITIES = {
+    'Plant A - North America': {
+        'efficiency_factor': 1.0,
+        'location': 'North America',
+        'capacity': 50000,
+        'sustainability_initiative': True,
+        'certifications': ['ISO_14001', 'LEED_Gold'],
+        'energy_source': 'Mixed (60% Renewable)',
+        'water_recycling_rate': 0.85,
+        'waste_recycling_rate': 0.92,
+        'employee_count': 150,
+        'production_hours_per_day': 16,
+        'maintenance_schedule': 'Preventive',
+        'technology_level': 'Advanced'
+    },
+    'Plant B - Europe': {
+        'efficiency_factor': 0.95,
+        'location': 'Europe',
+        'capacity': 45000,
+        'sustainability_initiative': False,
+        'certifications': ['ISO_14001'],
+        'energy_source': 'Grid (30% Renewable)',
+        'water_recycling_rate': 0.70,
+        'waste_recycling_rate': 0.78,
+        'employee_count': 120,
+        'production_hours_per_day': 14,
+        'maintenance_schedule': 'Reactive',
+        'technology_level': 'Standard'
+    },
+    'Plant C - Asia Pacific': {
+        'efficiency_factor': 0.90,
+        'location': 'Asia Pacific',
+        'capacity': 60000,
+        'sustainability_initiative': True,
+        'certifications': ['ISO_14001', 'ISO_50001'],
+        'energy_source': 'Solar + Grid',
+        'water_recycling_rate': 0.95,
+        'waste_recycling_rate': 0.88,
+        'employee_count': 200,
+        'production_hours_per_day': 20,
+        'maintenance_schedule': 'Predictive',
+        'technology_level': 'Cutting-edge'
+    }
+}
+
+# Define customer segments with more detail
+_CUSTOMER_SEGMENTS = {
+    'Retail': {
+        'price_sensitivity': 0.8,
+        'volume_factor': 0.7,
+        'sustainability_preference': 0.6,
+        'payment_terms': 'Net 30',
+        'order_frequency': 'Weekly',
+        'average_order_size': 1000,
+        'loyalty_level': 'Medium',
+        'growth_rate': 0.05
+    },
+    'Wholesale': {
+        'price_sensitivity': 0.6,
+        'volume_factor': 1.3,
+        'sustainability_preference': 0.4,
+        'payment_terms': 'Net 60',
+        'order_frequency': 'Monthly',
+        'average_order_size': 5000,
+        'loyalty_level': 'High',
+        'growth_rate': 0.08
+    },
+    'Food & Beverage': {
+        'price_sensitivity': 0.7,
+        'volume_factor': 1.1,
+        'sustainability_preference': 0.8,
+        'payment_terms': 'Net 45',
+        'order_frequency': 'Bi-weekly',
+        'average_order_size': 3000,
+        'loyalty_level': 'High',
+        'growth_rate': 0.12
+    },
+    'Pharmaceutical': {
+        'price_sensitivity': 0.4,
+        'volume_factor': 0.8,
+        'sustainability_preference': 0.5,
+        'payment_terms': 'Net 90',
+        'order_frequency': 'Monthly',
+        'average_order_size': 2000,
+        'loyalty_level': 'Very High',
+        'growth_rate': 0.15
+    },
+    'E-commerce': {
+        'price_sensitivity': 0.9,
+        'volume_factor': 1.5,
+        'sustainability_preference': 0.7,
+        'payment_terms': 'Net 15',
+        'order_frequency': 'Daily',
+        'average_order_size': 500,
+        'loyalty_level': 'Low',
+        'growth_rate': 0.20
+    }
+}
+
+# Define regions with market characteristics
+_REGIONS = {
+    'North America': {
+        'market_growth': 0.02,
+        'price_premium': 1.0,
+        'sustainability_demand': 0.7,
+        'regulatory_environment': 'Moderate',
+        'competition_level': 'High',
+        'logistics_cost_factor': 1.0,
+        'currency': 'USD',
+        'timezone': 'EST'
+    },
+    'Europe': {
+        'market_growth': 0.015,
+        'price_premium': 1.1,
+        'sustainability_demand': 0.8,
+        'regulatory_environment': 'Strict',
+        'competition_level': 'Medium',
+        'logistics_cost_factor': 1.2,
+        'currency': 'EUR',
+        'timezone': 'CET'
+    },
+    'Asia Pacific': {
+        'market_growth': 0.08,
+        'price_premium': 0.9,
+        'sustainability_demand': 0.5,
+        'regulatory_environment': 'Variable',
+        'competition_level': 'Very High',
+        'logistics_cost_factor': 0.8,
+        'currency': 'USD',
+        'timezone': 'SGT'
+    },
+    'Latin America': {
+        'market_growth': 0.06,
+        'price_premium': 0.85,
+        'sustainability_demand': 0.4,
+        'regulatory_environment': 'Developing',
+        'competition_level': 'Medium',
+        'logistics_cost_factor': 1.1,
+        'currency': 'USD',
+        'timezone': 'BRT'
+    }
+}
+
+# Define suppliers for supply chain simulation
+_SUPPLIERS = {
+    'Green Materials Co': {
+        'reliability': 0.95,
+        'cost_factor': 1.1,
+        'sustainability_rating': 5,
+        'delivery_time_days': 7,
+        'quality_rating': 0.98,
+        'certifications': ['FSC', 'ISO_14001']
+    },
+    'Standard Supply Inc': {
+        'reliability': 0.88,
+        'cost_factor': 1.0,
+        'sustainability_rating': 3,
+        'delivery_time_days': 5,
+        'quality_rating': 0.95,
+        'certifications': ['ISO_9001']
+    },
+    'EcoTech Solutions': {
+        'reliability': 0.92,
+        'cost_factor': 1.2,
+        'sustainability_rating': 5,
+        'delivery_time_days': 10,
+        'quality_rating': 0.99,
+        'certifications': ['FSC', 'ISO_14001', 'Cradle_to_Cradle']
+    }
+}
+
 class MockDataGenerator:
     """Generate realistic mock data for PackagingCo BI portfolio."""
     
     def __init__(self, seed: int = 42):
         """Initialize the data generator with a random seed."""
-        np.random.seed(seed)
+        # Generator API instead of the legacy global RandomState: faster
+        # draws, and the seed stays local to this instance
+        self._rng = np.random.default_rng(seed)
         random.seed(seed)
         
-        # Define product configurations with more realistic details
-        self.products = {
-            'Plastic Containers': {
-                'base_cost': 3.0,
-                'base_price': 5.0,
-                'emissions_factor': 0.8,  # kg CO2 per unit
-                'energy_factor': 2.5,     # kWh per unit
-                'water_factor': 1.2,      # liters per unit
-                'waste_factor': 0.1,      # kg waste per unit
-                'recycled_material_potential': 0.6,  # max % recycled
-                'virgin_material_potential': 0.4,    # min % virgin
-                'sku_prefix': 'PLASTIC',
-                'weight_kg': 0.5,
-                'volume_liters': 1.0,
-                'shelf_life_days': 365,
-                'regulatory_compliance': ['FDA', 'EU_Food_Safe'],
-                'sustainability_rating': 3  # 1-5 scale
-            },
-            'Paper Packaging': {
-                'base_cost': 2.5,
-                'base_price': 4.5,
-                'emissions_factor': 0.5,
-                'energy_factor': 1.8,
-                'water_factor': 0.8,
-                'waste_factor': 0.05,
-                'recycled_material_potential': 0.8,
-                'virgin_material_potential': 0.2,
-                'sku_prefix': 'PAPER',
-                'weight_kg': 0.3,
-                'volume_liters': 0.8,
-                'shelf_life_days': 180,
-                'regulatory_compliance': ['FDA', 'FSC_Certified'],
-                'sustainability_rating': 4
-            },
-            'Glass Bottles': {
-                'base_cost': 4.0,
-                'base_price': 8.0,
-                'emissions_factor': 1.2,
-                'energy_factor': 4.0,
-                'water_factor': 2.0,
-                'waste_factor': 0.15,
-                'recycled_material_potential': 0.3,
-                'virgin_material_potential': 0.7,
-                'sku_prefix': 'GLASS',
-                'weight_kg': 1.2,
-                'volume_liters': 1.5,
-                'shelf_life_days': 730,
-                'regulatory_compliance': ['FDA', 'EU_Food_Safe', 'Recyclable'],
-                'sustainability_rating': 5
-            },
-            'Aluminum Cans': {
-                'base_cost': 3.5,
-                'base_price': 6.5,
-                'emissions_factor': 1.0,
-                'energy_factor': 3.2,
-                'water_factor': 1.5,
-                'waste_factor': 0.08,
-                'recycled_material_potential': 0.7,
-                'virgin_material_potential': 0.3,
-                'sku_prefix': 'ALUM',
-                'weight_kg': 0.4,
-                'volume_liters': 0.5,
-                'shelf_life_days': 1095,
-                'regulatory_compliance': ['FDA', 'Recyclable'],
-                'sustainability_rating': 4
-            },
-            'Biodegradable Packaging': {
-                'base_cost': 4.5,
-                'base_price': 7.5,
-                'emissions_factor': 0.3,
-                'energy_factor': 1.5,
-                'water_factor': 0.6,
-                'waste_factor': 0.02,
-                'recycled_material_potential': 0.9,
-                'virgin_material_potential': 0.1,
-                'sku_prefix': 'BIO',
-                'weight_kg': 0.2,
-                'volume_liters': 0.6,
-                'shelf_life_days': 90,
-                'regulatory_compliance': ['FDA', 'Biodegradable', 'Compostable'],
-                'sustainability_rating': 5
-            }
-        }
-        
-        # Define facility configurations with more detail
-        self.facilities = {
-            'Plant A - North America': {
-                'efficiency_factor': 1.0,
-                'location': 'North America',
-                'capacity': 50000,
-                'sustainability_initiative': True,
-                'certifications': ['ISO_14001', 'LEED_Gold'],
-                'energy_source': 'Mixed (60% Renewable)',
-                'water_recycling_rate': 0.85,
-                'waste_recycling_rate': 0.92,
-                'employee_count': 150,
-                'production_hours_per_day': 16,
-                'maintenance_schedule': 'Preventive',
-                'technology_level': 'Advanced'
-            },
-            'Plant B - Europe': {
-                'efficiency_factor': 0.95,
-                'location': 'Europe',
-                'capacity': 45000,
-                'sustainability_initiative': False,
-                'certifications': ['ISO_14001'],
-                'energy_source': 'Grid (30% Renewable)',
-                'water_recycling_rate': 0.70,
-                'waste_recycling_rate': 0.78,
-                'employee_count': 120,
-                'production_hours_per_day': 14,
-                'maintenance_schedule': 'Reactive',
-                'technology_level': 'Standard'
-            },
-            'Plant C - Asia Pacific': {
-                'efficiency_factor': 0.90,
-                'location': 'Asia Pacific',
-                'capacity': 60000,
-                'sustainability_initiative': True,
-                'certifications': ['ISO_14001', 'ISO_50001'],
-                'energy_source': 'Solar + Grid',
-                'water_recycling_rate': 0.95,
-                'waste_recycling_rate': 0.88,
-                'employee_count': 200,
-                'production_hours_per_day': 20,
-                'maintenance_schedule': 'Predictive',
-                'technology_level': 'Cutting-edge'
-            }
-        }
-        
-        # Define customer segments with more detail
-        self.customer_segments = {
-            'Retail': {
-                'price_sensitivity': 0.8,
-                'volume_factor': 0.7,
-                'sustainability_preference': 0.6,
-                'payment_terms': 'Net 30',
-                'order_frequency': 'Weekly',
-                'average_order_size': 1000,
-                'loyalty_level': 'Medium',
-                'growth_rate': 0.05
-            },
-            'Wholesale': {
-                'price_sensitivity': 0.6,
-                'volume_factor': 1.3,
-                'sustainability_preference': 0.4,
-                'payment_terms': 'Net 60',
-                'order_frequency': 'Monthly',
-                'average_order_size': 5000,
-                'loyalty_level': 'High',
-                'growth_rate': 0.08
-            },
-            'Food & Beverage': {
-                'price_sensitivity': 0.7,
-                'volume_factor': 1.1,
-                'sustainability_preference': 0.8,
-                'payment_terms': 'Net 45',
-                'order_frequency': 'Bi-weekly',
-                'average_order_size': 3000,
-                'loyalty_level': 'High',
-                'growth_rate': 0.12
-            },
-            'Pharmaceutical': {
-                'price_sensitivity': 0.4,
-                'volume_factor': 0.8,
-                'sustainability_preference': 0.5,
-                'payment_terms': 'Net 90',
-                'order_frequency': 'Monthly',
-                'average_order_size': 2000,
-                'loyalty_level': 'Very High',
-                'growth_rate': 0.15
-            },
-            'E-commerce': {
-                'price_sensitivity': 0.9,
-                'volume_factor': 1.5,
-                'sustainability_preference': 0.7,
-                'payment_terms': 'Net 15',
-                'order_frequency': 'Daily',
-                'average_order_size': 500,
-                'loyalty_level': 'Low',
-                'growth_rate': 0.20
-            }
-        }
-        
-        # Define regions with market characteristics
-        self.regions = {
-            'North America': {
-                'market_growth': 0.02,
-                'price_premium': 1.0,
-                'sustainability_demand': 0.7,
-                'regulatory_environment': 'Moderate',
-                'competition_level': 'High',
-                'logistics_cost_factor': 1.0,
-                'currency': 'USD',
-                'timezone': 'EST'
-            },
-            'Europe': {
-                'market_growth': 0.015,
-                'price_premium': 1.1,
-                'sustainability_demand': 0.8,
-                'regulatory_environment': 'Strict',
-                'competition_level': 'Medium',
-                'logistics_cost_factor': 1.2,
-                'currency': 'EUR',
-                'timezone': 'CET'
-            },
-            'Asia Pacific': {
-                'market_growth': 0.08,
-                'price_premium': 0.9,
-                'sustainability_demand': 0.5,
-                'regulatory_environment': 'Variable',
-                'competition_level': 'Very High',
-                'logistics_cost_factor': 0.8,
-                'currency': 'USD',
-                'timezone': 'SGT'
-            },
-            'Latin America': {
-                'market_growth': 0.06,
-                'price_premium': 0.85,
-                'sustainability_demand': 0.4,
-                'regulatory_environment': 'Developing',
-                'competition_level': 'Medium',
-                'logistics_cost_factor': 1.1,
-                'currency': 'USD',
-                'timezone': 'BRT'
-            }
-        }
-        
-        # Define suppliers for supply chain simulation
-        self.suppliers = {
-            'Green Materials Co': {
-                'reliability': 0.95,
-                'cost_factor': 1.1,
-                'sustainability_rating': 5,
-                'delivery_time_days': 7,
-                'quality_rating': 0.98,
-                'certifications': ['FSC', 'ISO_14001']
-            },
-            'Standard Supply Inc': {
-                'reliability': 0.88,
-                'cost_factor': 1.0,
-                'sustainability_rating': 3,
-                'delivery_time_days': 5,
-                'quality_rating': 0.95,
-                'certifications': ['ISO_9001']
-            },
-            'EcoTech Solutions': {
-                'reliability': 0.92,
-                'cost_factor': 1.2,
-                'sustainability_rating': 5,
-                'delivery_time_days': 10,
-                'quality_rating': 0.99,
-                'certifications': ['FSC', 'ISO_14001', 'Cradle_to_Cradle']
-            }
-        }
+        # Constant configuration lives at module scope; bind references so
+        # existing self.* consumers keep working without rebuilding the
+        # dicts on every instantiation
+        self.products = _PRODUCTS
+        self.facilities = _FACILITIES
+        self.customer_segments = _CUSTOMER_SEGMENTS
+        self.regions = _REGIONS
+        self.suppliers = _SUPPLIERS
 
     def generate_transaction_level_sales(self, 
                                        start_date: str = '2023-01-01',
@@ -311,7 +322,7 @@ class MockDataGenerator:
                 # Generate realistic quantities with segment-based variation
                 segment_config = self.customer_segments[customer_segment]
                 base_quantity = segment_config['average_order_size']
-                quantity = int(np.random.normal(base_quantity, base_quantity * 0.3))
+                quantity = int(self._rng.normal(base_quantity, base_quantity * 0.3))
                 quantity = max(1, quantity)  # Ensure positive
                 
                 # Calculate costs and prices with realistic variation
@@ -551,8 +562,9 @@ class MockDataGenerator:
         
         return pd.DataFrame(supply_chain_records)
 
-    def aggregate_to_monthly(self, transaction_df: pd.DataFrame, 
-                           group_columns: List[str]) -> pd.DataFrame:
+    @staticmethod
+    def aggregate_to_monthly(transaction_df: pd.DataFrame,
+                             group_columns: List[str]) -> pd.DataFrame:
         """
         Aggregate transaction-level data to monthly level.
         
@@ -590,7 +602,8 @@ class MockDataGenerator:
         
         return monthly_data
 
-    def aggregate_esg_to_monthly(self, esg_df: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def aggregate_esg_to_monthly(esg_df: pd.DataFrame) -> pd.DataFrame:
         """
         Aggregate ESG transaction data to monthly level.
         